@@ -15,13 +15,16 @@ Output:
 Returns: True if changes detected, False otherwise
 """
 
-import json
+import logging
+import mmap
+import os
+import re
 import sys
+from collections import Counter
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Any, Optional
-from pydantic import BaseModel, Field
-from enum import Enum
+from typing import Any, Final, Literal, Optional, TypedDict
+import orjson
 
 
 # Paths
@@ -31,40 +34,71 @@ CURRENT_DIR = DATA_DIR / "current"
 HISTORY_DIR = DATA_DIR / "history"
 CHANGELOG_DIR = DATA_DIR / "changelog"
 
-
-class ChangeType(str, Enum):
-    """Types of changes that can be detected."""
-    PRICE_INCREASE = "price_increase"
-    PRICE_DECREASE = "price_decrease"
-    NEW_MODEL = "new_model"
-    REMOVED_MODEL = "removed_model"
-    CONTEXT_CHANGE = "context_change"
-    CAPABILITY_CHANGE = "capability_change"
-    CACHE_PRICE_CHANGE = "cache_price_change"
-
-
-class Change(BaseModel):
+# History layout: YYYY/MM/DD.json
+YEAR_PATTERN = re.compile(r"\d{4}")
+MONTH_PATTERN = re.compile(r"\d{2}")
+DAY_PATTERN = re.compile(r"\d{2}\.json")
+
+
+# Console output
+RULE = "=" * 60
+
+logger = logging.getLogger(__name__)
+
+# Types of changes that can be detected
+PRICE_INCREASE: Final = "price_increase"
+PRICE_DECREASE: Final = "price_decrease"
+NEW_MODEL: Final = "new_model"
+REMOVED_MODEL: Final = "removed_model"
+CONTEXT_CHANGE: Final = "context_change"
+CAPABILITY_CHANGE: Final = "capability_change"
+CACHE_PRICE_CHANGE: Final = "cache_price_change"
+
+ChangeType = Literal[
+    "price_increase",
+    "price_decrease",
+    "new_model",
+    "removed_model",
+    "context_change",
+    "capability_change",
+    "cache_price_change",
+]
+
+# Fields compared for models present in both snapshots:
+# (field, read from the "pricing" dict, change type, value of a missing field).
+# A change type of None means price_increase/price_decrease by direction.
+# A missing value of None compares and reports nulls as-is.
+DIFF_FIELDS: Final = (
+    ("input_per_million", True, None, 0.0),
+    ("output_per_million", True, None, 0.0),
+    ("cache_read_per_million", True, CACHE_PRICE_CHANGE, None),
+    ("cache_creation_per_million", True, CACHE_PRICE_CHANGE, None),
+    ("context_window", False, CONTEXT_CHANGE, 0),
+)
+
+
+class Change(TypedDict):
     """A single price or model change."""
     model_id: str
     change_type: ChangeType
-    field: Optional[str] = None
-    old_value: Optional[Any] = None
-    new_value: Optional[Any] = None
-    percent_change: Optional[float] = None
+    field: Optional[str]
+    old_value: Optional[Any]
+    new_value: Optional[Any]
+    percent_change: Optional[float]
     detected_at: str
 
 
-class ChangelogSummary(BaseModel):
+class ChangelogSummary(TypedDict):
     """Summary statistics for a changelog."""
-    price_increases: int = 0
-    price_decreases: int = 0
-    new_models: int = 0
-    removed_models: int = 0
-    cache_price_changes: int = 0
-    other_changes: int = 0
+    price_increases: int
+    price_decreases: int
+    new_models: int
+    removed_models: int
+    cache_price_changes: int
+    other_changes: int
 
 
-class Changelog(BaseModel):
+class Changelog(TypedDict):
     """Complete changelog for a price update."""
     generated_at: str
     changes: list[Change]
@@ -72,49 +106,114 @@ class Changelog(BaseModel):
 
 
 def load_json(filepath: Path) -> dict[str, Any]:
-    """Load a JSON file and return its contents."""
+    """
+    Load a JSON file and return its contents.
+    
+    The file is memory-mapped and parsed straight from the mapping, avoiding
+    an intermediate copy of large snapshots. Empty files can't be mapped and
+    are read normally.
+    """
     if not filepath.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
     
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
 
 
-def save_json(filepath: Path, data: Any) -> None:
-    """Save data to a JSON file with pretty formatting."""
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"✓ Saved: {filepath}")
+def write_atomic(filepath: Path, payload: bytes) -> None:
+    """
+    Write bytes to a file atomically.
+
+    The payload goes to a sibling temp file that is fsynced and then renamed
+    over the target, so readers never observe a half-written file.
+    """
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, filepath)
+
+
+def _save_json(data: Any, option: int, *filepaths: Path) -> None:
+    """Serialize data once and write it atomically to each of filepaths."""
+    payload = orjson.dumps(data, option=option | orjson.OPT_APPEND_NEWLINE)
+    for filepath in filepaths:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(filepath, payload)
+        logger.info("✓ Saved: %s", filepath)
+
+
+def save_json_pretty(data: Any, *filepaths: Path) -> None:
+    """Save data as indented JSON, for human-facing changelog files."""
+    _save_json(data, orjson.OPT_INDENT_2, *filepaths)
+
+
+def save_json_compact(data: Any, *filepaths: Path) -> None:
+    """Save data as compact JSON, for machine-read history snapshots."""
+    _save_json(data, 0, *filepaths)
+
+
+def _scan_sorted(directory: Path, pattern: re.Pattern[str], dirs: bool) -> list[os.DirEntry[str]]:
+    """List entries of a directory matching a name pattern, newest name first."""
+    try:
+        with os.scandir(directory) as it:
+            entries = [
+                entry for entry in it
+                if pattern.fullmatch(entry.name) and entry.is_dir() == dirs
+            ]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda entry: entry.name, reverse=True)
+    return entries
 
 
 def find_previous_snapshot() -> Optional[Path]:
     """
     Find most recent file in data/history/.
     
-    Traverses the history directory structure (YYYY/MM/DD.json) to find
-    the most recent snapshot file.
+    Descends the history directory structure (YYYY/MM/DD.json) picking the
+    latest year, month and day in turn, so only a handful of directories
+    are listed regardless of how much history exists. Falls back to a full
+    recursive search if the layout doesn't match.
     
     Returns:
         Path to most recent snapshot, or None if no history exists
     """
     if not HISTORY_DIR.exists():
-        print("⚠ No history directory found - this appears to be the first run")
+        logger.warning("⚠ No history directory found - this appears to be the first run")
         return None
     
-    # Find all JSON files in history
-    json_files = list(HISTORY_DIR.rglob("*.json"))
-    
-    if not json_files:
-        print("⚠ No history files found - this appears to be the first run")
-        return None
-    
-    # Sort by path (which is date-based) and get most recent
-    # Path format: YYYY/MM/DD.json
-    json_files.sort(reverse=True)
+    most_recent = None
+    
+    # Backtrack into older directories only if a newer one is empty
+    for year in _scan_sorted(HISTORY_DIR, YEAR_PATTERN, dirs=True):
+        for month in _scan_sorted(Path(year.path), MONTH_PATTERN, dirs=True):
+            days = _scan_sorted(Path(month.path), DAY_PATTERN, dirs=False)
+            if days:
+                most_recent = Path(days[0].path)
+                break
+        if most_recent is not None:
+            break
+    
+    if most_recent is None:
+        # Unexpected layout - sort every JSON file by path
+        json_files = sorted(HISTORY_DIR.rglob("*.json"), reverse=True)
+        
+        if not json_files:
+            logger.warning("⚠ No history files found - this appears to be the first run")
+            return None
+        
+        most_recent = json_files[0]
     
-    most_recent = json_files[0]
-    print(f"✓ Found previous snapshot: {most_recent}")
+    logger.info("✓ Found previous snapshot: %s", most_recent)
     
     return most_recent
 
@@ -140,7 +239,8 @@ def calculate_percent_change(old_value: float, new_value: float) -> float:
 
 def detect_price_changes(
     old_data: dict[str, Any],
-    new_data: dict[str, Any]
+    new_data: dict[str, Any],
+    detected_at: str
 ) -> list[Change]:
     """
     Compare each model's pricing between old and new data.
@@ -155,44 +255,102 @@ def detect_price_changes(
     Args:
         old_data: Previous prices.json content
         new_data: Current prices.json content
+        detected_at: ISO timestamp of this run, stamped on every change
         
     Returns:
         List of detected changes
+
+    Changes are plain dicts: both snapshots were already validated by
+    normalize.py, and the changelog is serialized as-is.
     """
     changes: list[Change] = []
-    now = datetime.now(timezone.utc).isoformat()
     
     old_models = old_data.get("models", {})
     new_models = new_data.get("models", {})
     
-    old_model_ids = set(old_models.keys())
-    new_model_ids = set(new_models.keys())
-    
-    # Detect new models
-    for model_id in new_model_ids - old_model_ids:
-        new_model = new_models[model_id]
-        pricing = new_model.get("pricing", {})
-        changes.append(Change(
-            model_id=model_id,
-            change_type=ChangeType.NEW_MODEL,
-            field="model",
-            old_value=None,
-            new_value={
-                "input_per_million": pricing.get("input_per_million"),
-                "output_per_million": pricing.get("output_per_million"),
-                "cache_read_per_million": pricing.get("cache_read_per_million"),
-                "cache_creation_per_million": pricing.get("cache_creation_per_million"),
-            },
-            detected_at=now
-        ))
+    # Single pass over the new snapshot: new models and per-model diffs
+    for model_id, new_model in new_models.items():
+        old_model = old_models.get(model_id)
+        new_pricing = new_model.get("pricing", {})
+        
+        # Detect new models
+        if old_model is None:
+            changes.append(Change(
+                model_id=model_id,
+                change_type=NEW_MODEL,
+                field="model",
+                old_value=None,
+                new_value={
+                    "input_per_million": new_pricing.get("input_per_million"),
+                    "output_per_million": new_pricing.get("output_per_million"),
+                    "cache_read_per_million": new_pricing.get("cache_read_per_million"),
+                    "cache_creation_per_million": new_pricing.get("cache_creation_per_million"),
+                },
+                percent_change=None,
+                detected_at=detected_at
+            ))
+            continue
+        
+        old_pricing = old_model.get("pricing", {})
+        
+        # Most models are unchanged between snapshots; a single C-level dict
+        # comparison rules them out before any per-field work
+        if (
+            old_pricing == new_pricing
+            and old_model.get("context_window") == new_model.get("context_window")
+        ):
+            continue
+        
+        for field, in_pricing, change_type, missing in DIFF_FIELDS:
+            if in_pricing:
+                old_value = old_pricing.get(field)
+                new_value = new_pricing.get(field)
+            else:
+                old_value = old_model.get(field)
+                new_value = new_model.get(field)
+            
+            if old_value == new_value:
+                continue
+            
+            if missing is not None:
+                # Missing/null and 0 are all "no value"; only a real value moving counts.
+                # Substitute only for missing values so real values keep their type.
+                if old_value is None:
+                    old_value = missing
+                if new_value is None:
+                    new_value = missing
+                if old_value == new_value:
+                    continue
+            
+            if change_type is None:
+                changes.append(Change(
+                    model_id=model_id,
+                    change_type=PRICE_INCREASE if new_value > old_value else PRICE_DECREASE,
+                    field=field,
+                    old_value=old_value,
+                    new_value=new_value,
+                    percent_change=calculate_percent_change(old_value, new_value),
+                    detected_at=detected_at
+                ))
+            else:
+                old_num = 0 if old_value is None else old_value
+                new_num = 0 if new_value is None else new_value
+                changes.append(Change(
+                    model_id=model_id,
+                    change_type=change_type,
+                    field=field,
+                    old_value=old_value,
+                    new_value=new_value,
+                    percent_change=calculate_percent_change(old_num, new_num) if old_num > 0 else None,
+                    detected_at=detected_at
+                ))
     
     # Detect removed models
-    for model_id in old_model_ids - new_model_ids:
-        old_model = old_models[model_id]
-        pricing = old_model.get("pricing", {})
+    for model_id in old_models.keys() - new_models.keys():
+        pricing = old_models[model_id].get("pricing", {})
         changes.append(Change(
             model_id=model_id,
-            change_type=ChangeType.REMOVED_MODEL,
+            change_type=REMOVED_MODEL,
             field="model",
             old_value={
                 "input_per_million": pricing.get("input_per_million"),
@@ -201,157 +359,64 @@ def detect_price_changes(
                 "cache_creation_per_million": pricing.get("cache_creation_per_million"),
             },
             new_value=None,
-            detected_at=now
+            percent_change=None,
+            detected_at=detected_at
         ))
     
-    # Detect price changes for existing models
-    for model_id in old_model_ids & new_model_ids:
-        old_model = old_models[model_id]
-        new_model = new_models[model_id]
-        
-        old_pricing = old_model.get("pricing", {})
-        new_pricing = new_model.get("pricing", {})
-        
-        # Check input price
-        old_input = old_pricing.get("input_per_million", 0)
-        new_input = new_pricing.get("input_per_million", 0)
-        
-        if old_input != new_input:
-            percent = calculate_percent_change(old_input, new_input)
-            change_type = ChangeType.PRICE_INCREASE if new_input > old_input else ChangeType.PRICE_DECREASE
-            changes.append(Change(
-                model_id=model_id,
-                change_type=change_type,
-                field="input_per_million",
-                old_value=old_input,
-                new_value=new_input,
-                percent_change=percent,
-                detected_at=now
-            ))
-        
-        # Check output price
-        old_output = old_pricing.get("output_per_million", 0)
-        new_output = new_pricing.get("output_per_million", 0)
-        
-        if old_output != new_output:
-            percent = calculate_percent_change(old_output, new_output)
-            change_type = ChangeType.PRICE_INCREASE if new_output > old_output else ChangeType.PRICE_DECREASE
-            changes.append(Change(
-                model_id=model_id,
-                change_type=change_type,
-                field="output_per_million",
-                old_value=old_output,
-                new_value=new_output,
-                percent_change=percent,
-                detected_at=now
-            ))
-        
-        # Check cache read price
-        old_cache_read = old_pricing.get("cache_read_per_million")
-        new_cache_read = new_pricing.get("cache_read_per_million")
-        
-        if old_cache_read != new_cache_read and (old_cache_read is not None or new_cache_read is not None):
-            old_val = old_cache_read or 0
-            new_val = new_cache_read or 0
-            percent = calculate_percent_change(old_val, new_val) if old_val > 0 else None
-            changes.append(Change(
-                model_id=model_id,
-                change_type=ChangeType.CACHE_PRICE_CHANGE,
-                field="cache_read_per_million",
-                old_value=old_cache_read,
-                new_value=new_cache_read,
-                percent_change=percent,
-                detected_at=now
-            ))
-        
-        # Check cache creation price
-        old_cache_creation = old_pricing.get("cache_creation_per_million")
-        new_cache_creation = new_pricing.get("cache_creation_per_million")
-        
-        if old_cache_creation != new_cache_creation and (old_cache_creation is not None or new_cache_creation is not None):
-            old_val = old_cache_creation or 0
-            new_val = new_cache_creation or 0
-            percent = calculate_percent_change(old_val, new_val) if old_val > 0 else None
-            changes.append(Change(
-                model_id=model_id,
-                change_type=ChangeType.CACHE_PRICE_CHANGE,
-                field="cache_creation_per_million",
-                old_value=old_cache_creation,
-                new_value=new_cache_creation,
-                percent_change=percent,
-                detected_at=now
-            ))
-        
-        # Check context window changes
-        old_context = old_model.get("context_window", 0)
-        new_context = new_model.get("context_window", 0)
-        
-        if old_context != new_context and (old_context > 0 or new_context > 0):
-            changes.append(Change(
-                model_id=model_id,
-                change_type=ChangeType.CONTEXT_CHANGE,
-                field="context_window",
-                old_value=old_context,
-                new_value=new_context,
-                percent_change=calculate_percent_change(old_context, new_context) if old_context > 0 else None,
-                detected_at=now
-            ))
-    
     return changes
 
 
-def generate_changelog(changes: list[Change]) -> Changelog:
+def generate_changelog(changes: list[Change], generated_at: str) -> Changelog:
     """
     Create changelog object with summary statistics.
     
     Args:
         changes: List of detected changes
+        generated_at: ISO timestamp of this run
         
     Returns:
         Complete changelog with summary
     """
-    summary = ChangelogSummary()
-    
-    for change in changes:
-        if change.change_type == ChangeType.PRICE_INCREASE:
-            summary.price_increases += 1
-        elif change.change_type == ChangeType.PRICE_DECREASE:
-            summary.price_decreases += 1
-        elif change.change_type == ChangeType.NEW_MODEL:
-            summary.new_models += 1
-        elif change.change_type == ChangeType.REMOVED_MODEL:
-            summary.removed_models += 1
-        elif change.change_type == ChangeType.CACHE_PRICE_CHANGE:
-            summary.cache_price_changes += 1
-        else:
-            summary.other_changes += 1
+    counts = Counter(change["change_type"] for change in changes)
+    
+    summary = ChangelogSummary(
+        price_increases=counts.pop(PRICE_INCREASE, 0),
+        price_decreases=counts.pop(PRICE_DECREASE, 0),
+        new_models=counts.pop(NEW_MODEL, 0),
+        removed_models=counts.pop(REMOVED_MODEL, 0),
+        cache_price_changes=counts.pop(CACHE_PRICE_CHANGE, 0),
+        other_changes=counts.total()
+    )
     
     return Changelog(
-        generated_at=datetime.now(timezone.utc).isoformat(),
+        generated_at=generated_at,
         changes=changes,
         summary=summary
     )
 
 
-def save_history_snapshot(prices_data: dict[str, Any]) -> Path:
+def save_history_snapshot(prices_data: dict[str, Any], run_now: datetime) -> Path:
     """
     Save current prices to history directory.
     
     File is saved as: data/history/YYYY/MM/DD.json
     
+    Snapshots are only read back by later runs of this script, so they are
+    stored as compact JSON rather than indented like prices.json.
+    
     Args:
         prices_data: Current prices.json content
+        run_now: Start time of this run, which names the snapshot
         
     Returns:
         Path to saved file
     """
-    now = datetime.now(timezone.utc)
-    year = str(now.year)
-    month = f"{now.month:02d}"
-    day = f"{now.day:02d}"
+    year = str(run_now.year)
+    month = f"{run_now.month:02d}"
+    day = f"{run_now.day:02d}"
     
     history_path = HISTORY_DIR / year / month / f"{day}.json"
-    save_json(history_path, prices_data)
+    save_json_compact(prices_data, history_path)
     
     return history_path
 
@@ -370,79 +435,82 @@ def main() -> bool:
     Returns:
         True if changes were detected, False otherwise
     """
-    print("=" * 60)
-    print("LLM Price Tracker - Change Detection")
-    print(f"Started at: {datetime.now(timezone.utc).isoformat()}")
-    print("=" * 60)
+    # One timestamp for the whole run keeps every emitted record consistent
+    run_now = datetime.now(timezone.utc)
+    run_ts_iso = run_now.isoformat()
+    
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
+    logger.info("%s\nLLM Price Tracker - Change Detection\nStarted at: %s\n%s", RULE, run_ts_iso, RULE)
     
     # Load current data
-    print("\n📂 Loading current prices...")
+    logger.info("\n📂 Loading current prices...")
     current_path = CURRENT_DIR / "prices.json"
     
     if not current_path.exists():
-        print("❌ No current prices.json found. Run normalize.py first.")
+        logger.error("❌ No current prices.json found. Run normalize.py first.")
         return False
     
     current_data = load_json(current_path)
-    print(f"✓ Loaded current prices: {current_data.get('metadata', {}).get('total_models', 0)} models")
+    logger.info("✓ Loaded current prices: %s models", current_data.get("metadata", {}).get("total_models", 0))
     
     # Find previous snapshot
-    print("\n🔍 Looking for previous snapshot...")
+    logger.info("\n🔍 Looking for previous snapshot...")
     previous_path = find_previous_snapshot()
     
     has_changes = False
     
     if previous_path is None:
         # First run - no changes to detect
-        print("ℹ First run detected - no changes to compare")
+        logger.info("ℹ First run detected - no changes to compare")
     else:
         # Load previous and detect changes
         previous_data = load_json(previous_path)
-        print(f"✓ Loaded previous: {previous_data.get('metadata', {}).get('total_models', 0)} models")
+        logger.info("✓ Loaded previous: %s models", previous_data.get("metadata", {}).get("total_models", 0))
         
-        print("\n🔄 Detecting changes...")
-        changes = detect_price_changes(previous_data, current_data)
+        logger.info("\n🔄 Detecting changes...")
+        changes = detect_price_changes(previous_data, current_data, run_ts_iso)
         
         if changes:
             has_changes = True
-            changelog = generate_changelog(changes)
+            changelog = generate_changelog(changes, run_ts_iso)
+            summary = changelog["summary"]
             
-            print(f"\n📊 Changes detected:")
-            print(f"   Price increases: {changelog.summary.price_increases}")
-            print(f"   Price decreases: {changelog.summary.price_decreases}")
-            print(f"   Cache price changes: {changelog.summary.cache_price_changes}")
-            print(f"   New models: {changelog.summary.new_models}")
-            print(f"   Removed models: {changelog.summary.removed_models}")
-            print(f"   Other changes: {changelog.summary.other_changes}")
+            logger.info(
+                "\n📊 Changes detected:\n"
+                "   Price increases: %(price_increases)d\n"
+                "   Price decreases: %(price_decreases)d\n"
+                "   Cache price changes: %(cache_price_changes)d\n"
+                "   New models: %(new_models)d\n"
+                "   Removed models: %(removed_models)d\n"
+                "   Other changes: %(other_changes)d",
+                summary
+            )
             
             # Save changelog
-            print("\n💾 Saving changelog...")
+            logger.info("\n💾 Saving changelog...")
             CHANGELOG_DIR.mkdir(parents=True, exist_ok=True)
             
-            changelog_dict = changelog.model_dump()
-            
-            # Convert enum values to strings for JSON serialization
-            for change in changelog_dict["changes"]:
-                if isinstance(change["change_type"], ChangeType):
-                    change["change_type"] = change["change_type"].value
-            
-            save_json(CHANGELOG_DIR / "latest.json", changelog_dict)
-            
-            today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-            save_json(CHANGELOG_DIR / f"{today}.json", changelog_dict)
+            # Serialized once and written to both files; they are not
+            # hard-linked because send_alerts.py rewrites latest.json.
+            today = run_now.strftime("%Y-%m-%d")
+            save_json_pretty(
+                changelog,
+                CHANGELOG_DIR / f"{today}.json",
+                CHANGELOG_DIR / "latest.json"
+            )
         else:
-            print("✓ No price changes detected")
+            logger.info("✓ No price changes detected")
     
     # Save current to history
-    print("\n📁 Saving to history...")
-    history_path = save_history_snapshot(current_data)
+    logger.info("\n📁 Saving to history...")
+    history_path = save_history_snapshot(current_data, run_now)
     
-    print("\n" + "=" * 60)
     if has_changes:
-        print("✅ Change detection completed - CHANGES FOUND!")
+        status = "✅ Change detection completed - CHANGES FOUND!"
     else:
-        print("✅ Change detection completed - no changes")
-    print("=" * 60)
+        status = "✅ Change detection completed - no changes"
+    logger.info("\n%s\n%s\n%s", RULE, status, RULE)
     
     return has_changes
 
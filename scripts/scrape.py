@@ -10,15 +10,20 @@ Data Sources:
 Output:
 - data/current/openrouter.json
 - data/current/litellm.json
+- data/current/{openrouter,litellm}.etag (ETag of the last full response)
 
 Credits: Original implementation from https://github.com/MrUnreal/LLMTracker
 """
 
-import json
+import asyncio
+import logging
+import os
+import sys
 import httpx
+import orjson
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
 
 
 # Configuration
@@ -29,10 +34,22 @@ LITELLM_RAW_URL = "https://raw.githubusercontent.com/BerriAI/litellm/main/model_
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 CURRENT_DIR = DATA_DIR / "current"
+OPENROUTER_PATH = CURRENT_DIR / "openrouter.json"
+LITELLM_PATH = CURRENT_DIR / "litellm.json"
 
 # HTTP client configuration
 REQUEST_TIMEOUT = 30.0  # seconds
 USER_AGENT = "tokenprice/1.0 (https://github.com/DiTo97/tokenprice)"
+ACCEPT_ENCODING = "gzip, br"
+CONNECT_RETRIES = 2
+
+# Console output
+RULE = "=" * 60
+
+logger = logging.getLogger(__name__)
+
+# Exit code when every source answered 304 Not Modified (EX_CONFIG)
+EXIT_UNCHANGED = 78
 
 
 def ensure_directories() -> None:
@@ -51,7 +68,26 @@ def ensure_directories() -> None:
     ]
     for directory in directories:
         directory.mkdir(parents=True, exist_ok=True)
-        print(f"✓ Directory ensured: {directory}")
+        logger.info("✓ Directory ensured: %s", directory)
+
+
+def write_atomic(filepath: Path, payload: bytes) -> None:
+    """
+    Write bytes to a file atomically.
+
+    The payload goes to a sibling temp file that is fsynced and then renamed
+    over the target, so readers never observe a half-written file.
+    """
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, filepath)
 
 
 def save_json(filepath: Path, data: Any) -> None:
@@ -66,14 +102,50 @@ def save_json(filepath: Path, data: Any) -> None:
         IOError: If the file cannot be written
     """
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"✓ Saved: {filepath}")
+        write_atomic(
+            filepath, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        logger.info("✓ Saved: %s", filepath)
     except IOError as e:
         raise IOError(f"Failed to save JSON to {filepath}: {e}") from e
 
 
-def scrape_openrouter() -> dict[str, Any]:
+def etag_path(filepath: Path) -> Path:
+    """Return the sidecar file storing the ETag for a cached response."""
+    return filepath.with_suffix(".etag")
+
+
+def conditional_headers(filepath: Path) -> dict[str, str]:
+    """
+    Build conditional request headers for a cached response.
+
+    An ``If-None-Match`` header is only sent when both the cached JSON and
+    its ETag sidecar exist, so a 304 can always be served from disk.
+
+    Args:
+        filepath: Path to the cached JSON file
+
+    Returns:
+        dict: Headers to merge into the request
+    """
+    sidecar = etag_path(filepath)
+    if filepath.exists() and sidecar.exists():
+        etag = sidecar.read_text(encoding="utf-8").strip()
+        if etag:
+            return {"If-None-Match": etag}
+    return {}
+
+
+def save_etag(filepath: Path, etag: Optional[str]) -> None:
+    """Store (or clear) the ETag sidecar for a cached response."""
+    sidecar = etag_path(filepath)
+    if etag:
+        sidecar.write_text(etag + "\n", encoding="utf-8")
+    else:
+        sidecar.unlink(missing_ok=True)
+
+
+async def scrape_openrouter(client: httpx.AsyncClient) -> Optional[dict[str, Any]]:
     """
     Fetch model data from OpenRouter API.
 
@@ -84,44 +156,51 @@ def scrape_openrouter() -> dict[str, Any]:
     - context_length: Maximum context window size
     - top_provider: Provider information
 
+    Args:
+        client: Shared async HTTP client
+
     Returns:
-        dict: Raw API response containing model data
+        dict: Raw API response containing model data, or None if the
+        cached data/current/openrouter.json is still current (HTTP 304)
 
     Raises:
         httpx.HTTPError: If the API request fails
         ValueError: If the response is not valid JSON
     """
-    print(f"\n📡 Fetching OpenRouter API: {OPENROUTER_API_URL}")
+    logger.info("\n📡 Fetching OpenRouter API: %s", OPENROUTER_API_URL)
 
     try:
-        with httpx.Client(timeout=REQUEST_TIMEOUT) as client:
-            response = client.get(
-                OPENROUTER_API_URL, headers={"User-Agent": USER_AGENT}
-            )
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Validate response structure
-            if not isinstance(data, dict):
-                raise ValueError(f"Expected dict response, got {type(data).__name__}")
-
-            if "data" not in data:
-                raise ValueError("Response missing 'data' field")
-
-            models = data.get("data", [])
-            print(f"✓ OpenRouter: Retrieved {len(models)} models")
-
-            # Add metadata
-            result = {
-                "source": "openrouter",
-                "fetched_at": datetime.now(timezone.utc).isoformat(),
-                "api_url": OPENROUTER_API_URL,
-                "model_count": len(models),
-                "data": models,
-            }
-
-            return result
+        response = await client.get(
+            OPENROUTER_API_URL, headers=conditional_headers(OPENROUTER_PATH)
+        )
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.info("✓ OpenRouter: Not modified, keeping cached data")
+            return None
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+
+        # Validate response structure
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected dict response, got {type(data).__name__}")
+
+        if "data" not in data:
+            raise ValueError("Response missing 'data' field")
+
+        models = data.get("data", [])
+        logger.info("✓ OpenRouter: Retrieved %d models", len(models))
+
+        # Add metadata
+        result = {
+            "source": "openrouter",
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "api_url": OPENROUTER_API_URL,
+            "etag": response.headers.get("etag"),
+            "model_count": len(models),
+            "data": models,
+        }
+
+        return result
 
     except httpx.HTTPStatusError as e:
         raise httpx.HTTPError(
@@ -129,11 +208,11 @@ def scrape_openrouter() -> dict[str, Any]:
         ) from e
     except httpx.RequestError as e:
         raise httpx.HTTPError(f"Failed to connect to OpenRouter API: {e}") from e
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"OpenRouter API returned invalid JSON: {e}") from e
 
 
-def scrape_litellm() -> dict[str, Any]:
+async def scrape_litellm(client: httpx.AsyncClient) -> Optional[dict[str, Any]]:
     """
     Fetch model pricing data from LiteLLM GitHub repository.
 
@@ -147,38 +226,45 @@ def scrape_litellm() -> dict[str, Any]:
     - max_input_tokens: Maximum input tokens
     - litellm_provider: Provider name
 
+    Args:
+        client: Shared async HTTP client
+
     Returns:
-        dict: Raw pricing data from LiteLLM
+        dict: Raw pricing data from LiteLLM, or None if the cached
+        data/current/litellm.json is still current (HTTP 304)
 
     Raises:
         httpx.HTTPError: If the request fails
         ValueError: If the response is not valid JSON
     """
-    print(f"\n📡 Fetching LiteLLM data: {LITELLM_RAW_URL}")
+    logger.info("\n📡 Fetching LiteLLM data: %s", LITELLM_RAW_URL)
 
     try:
-        with httpx.Client(timeout=REQUEST_TIMEOUT) as client:
-            response = client.get(LITELLM_RAW_URL, headers={"User-Agent": USER_AGENT})
-            response.raise_for_status()
+        response = await client.get(LITELLM_RAW_URL, headers=conditional_headers(LITELLM_PATH))
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.info("✓ LiteLLM: Not modified, keeping cached data")
+            return None
+        response.raise_for_status()
 
-            data = response.json()
+        data = orjson.loads(response.content)
 
-            # Validate response structure
-            if not isinstance(data, dict):
-                raise ValueError(f"Expected dict response, got {type(data).__name__}")
+        # Validate response structure
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected dict response, got {type(data).__name__}")
 
-            print(f"✓ LiteLLM: Retrieved {len(data)} model entries")
+        logger.info("✓ LiteLLM: Retrieved %d model entries", len(data))
 
-            # Add metadata wrapper
-            result = {
-                "source": "litellm",
-                "fetched_at": datetime.now(timezone.utc).isoformat(),
-                "source_url": LITELLM_RAW_URL,
-                "model_count": len(data),
-                "data": data,
-            }
+        # Add metadata wrapper
+        result = {
+            "source": "litellm",
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "source_url": LITELLM_RAW_URL,
+            "etag": response.headers.get("etag"),
+            "model_count": len(data),
+            "data": data,
+        }
 
-            return result
+        return result
 
     except httpx.HTTPStatusError as e:
         raise httpx.HTTPError(
@@ -186,51 +272,97 @@ def scrape_litellm() -> dict[str, Any]:
         ) from e
     except httpx.RequestError as e:
         raise httpx.HTTPError(f"Failed to fetch LiteLLM data: {e}") from e
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"LiteLLM data is not valid JSON: {e}") from e
 
 
-def main() -> None:
+async def fetch_all() -> tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]:
+    """
+    Fetch OpenRouter and LiteLLM data concurrently.
+
+    Both requests share one HTTP/2 client so connections and TLS sessions
+    are pooled, and total latency is that of the slower source. Failed
+    connection attempts are retried by the transport.
+
+    Returns:
+        Tuple of (openrouter_data, litellm_data); an entry is None when
+        that source answered 304 Not Modified
+
+    Raises:
+        Exception: If either source fails to scrape
+    """
+    async with httpx.AsyncClient(
+        timeout=REQUEST_TIMEOUT,
+        transport=httpx.AsyncHTTPTransport(http2=True, retries=CONNECT_RETRIES),
+        headers={"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING},
+    ) as client:
+        openrouter_data, litellm_data = await asyncio.gather(
+            scrape_openrouter(client), scrape_litellm(client), return_exceptions=True
+        )
+
+    if isinstance(openrouter_data, BaseException):
+        logger.error("❌ OpenRouter scraping failed: %s", openrouter_data)
+        raise openrouter_data
+    if isinstance(litellm_data, BaseException):
+        logger.error("❌ LiteLLM scraping failed: %s", litellm_data)
+        raise litellm_data
+
+    return openrouter_data, litellm_data
+
+
+def main() -> dict[str, bool]:
     """
     Main entry point for the scraper.
 
     Workflow:
     1. Ensure output directories exist
-    2. Fetch data from OpenRouter API
-    3. Fetch data from LiteLLM GitHub
-    4. Save both to data/current/ directory
+    2. Fetch data from OpenRouter API and LiteLLM GitHub concurrently
+    3. Save changed sources (and their ETags) to data/current/ directory
+
+    Returns:
+        dict: Whether each source returned new data, keyed
+        "openrouter_changed" and "litellm_changed"
 
     Raises:
         Exception: If any scraping operation fails
     """
-    print("=" * 60)
-    print("LLM Price Tracker - Scraper (tokenprice fork)")
-    print(f"Started at: {datetime.now(timezone.utc).isoformat()}")
-    print("=" * 60)
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    # httpx logs every request at INFO; the banner and save lines already cover it
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    logger.info(
+        "%s\nLLM Price Tracker - Scraper (tokenprice fork)\nStarted at: %s\n%s",
+        RULE, datetime.now(timezone.utc).isoformat(), RULE,
+    )
 
     # Step 1: Ensure directories exist
     ensure_directories()
 
-    # Step 2: Scrape OpenRouter
-    try:
-        openrouter_data = scrape_openrouter()
-        save_json(CURRENT_DIR / "openrouter.json", openrouter_data)
-    except Exception as e:
-        print(f"❌ OpenRouter scraping failed: {e}")
-        raise
+    # Step 2: Scrape OpenRouter and LiteLLM
+    openrouter_data, litellm_data = asyncio.run(fetch_all())
 
-    # Step 3: Scrape LiteLLM
-    try:
-        litellm_data = scrape_litellm()
-        save_json(CURRENT_DIR / "litellm.json", litellm_data)
-    except Exception as e:
-        print(f"❌ LiteLLM scraping failed: {e}")
-        raise
+    # Step 3: Save changed sources; a 304 leaves the cached file in place
+    for filepath, data in ((OPENROUTER_PATH, openrouter_data), (LITELLM_PATH, litellm_data)):
+        if data is not None:
+            save_json(filepath, data)
+            save_etag(filepath, data["etag"])
+
+    result = {
+        "openrouter_changed": openrouter_data is not None,
+        "litellm_changed": litellm_data is not None,
+    }
+
+    if any(result.values()):
+        status = "✅ Scraping completed successfully!"
+    else:
+        status = "✅ Scraping completed - both sources unchanged"
+    logger.info("\n%s\n%s\n%s", RULE, status, RULE)
 
-    print("\n" + "=" * 60)
-    print("✅ Scraping completed successfully!")
-    print("=" * 60)
+    return result
 
 
 if __name__ == "__main__":
-    main()
+    result = main()
+    # Exit with EX_CONFIG when nothing changed upstream so the workflow can
+    # skip normalize/detect_changes/generate_site entirely
+    sys.exit(0 if any(result.values()) else EXIT_UNCHANGED)
@@ -12,14 +12,22 @@ Environment Variables:
 - BUTTONDOWN_API_KEY: Buttondown API key for email alerts
 """
 
-import json
+import asyncio
+import functools
+import itertools
+import logging
 import os
+import random
 import sys
 import argparse
 import httpx
+import orjson
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from pathlib import Path
+from urllib.parse import quote
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 
 # Paths
@@ -30,6 +38,45 @@ CHANGELOG_DIR = DATA_DIR / "changelog"
 # Configuration
 WEBSITE_URL = "https://dito97.github.io/tokentracking"
 REQUEST_TIMEOUT = 30.0
+HTTP_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=8)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+RULE = "=" * 60
+logger = logging.getLogger(__name__)
+
+# Webhook retries on transient failures
+MAX_POST_ATTEMPTS = 4
+MAX_RETRY_DELAY = 30.0
+
+CHANNELS = ("discord", "slack", "email")
+
+# Change types that appear in alerts; others (e.g. context changes) are not reported
+REPORTED_CHANGE_TYPES = ("price_decrease", "price_increase", "new_model", "removed_model")
+
+# Lines shown per section, in section order
+DISCORD_SECTION_LIMITS = {"price_decrease": 10, "price_increase": 10, "new_model": 10, "removed_model": 5}
+SLACK_SECTION_LIMITS = {"price_decrease": 8, "price_increase": 8, "new_model": 8}
+EMAIL_SECTION_LIMITS = {"price_decrease": 15, "price_increase": 15, "new_model": 15}
+
+# Most lines any formatter shows per section: Slack/email use plain lines, Discord linked
+PLAIN_LINE_LIMIT = max(*SLACK_SECTION_LIMITS.values(), *EMAIL_SECTION_LIMITS.values())
+LINKED_LINE_LIMIT = max(DISCORD_SECTION_LIMITS.values())
+
+SECTION_TITLES = {
+    "price_decrease": "📉 Price Decreases",
+    "price_increase": "📈 Price Increases",
+    "new_model": "🆕 New Models",
+    "removed_model": "🗑️ Removed Models",
+}
+
+# Discord caps embed descriptions at 4096 UTF-16 code units; keep headroom
+DISCORD_DESCRIPTION_BUDGET = 3900
+
+
+@functools.lru_cache(maxsize=16)
+def _load_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a JSON file; keyed on (mtime, size) so edits invalidate the entry."""
+    return orjson.loads(Path(path).read_bytes())
 
 
 def load_json(filepath: Path) -> dict[str, Any]:
@@ -37,26 +84,75 @@ def load_json(filepath: Path) -> dict[str, Any]:
     if not filepath.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
     
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+    st = filepath.stat()
+    # Shallow copy so top-level edits (e.g. the notified flag) stay out of the cache
+    return dict(_load_cached(str(filepath), st.st_mtime_ns, st.st_size))
 
 
-def format_price(price: float) -> str:
-    """Format price for display."""
-    if price < 0.01:
-        return f"${price:.4f}"
-    elif price < 1:
-        return f"${price:.3f}"
-    else:
-        return f"${price:.2f}"
+def write_atomic(filepath: Path, payload: bytes) -> None:
+    """
+    Write bytes to a file atomically.
+
+    The payload goes to a sibling temp file that is fsynced and then renamed
+    over the target, so readers never observe a half-written file.
+    """
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, filepath)
+
+
+def _short_name(model_id: str) -> str:
+    """Strip the provider prefix from a model ID."""
+    return model_id.rsplit("/", 1)[-1]
+
+
+def _fmt_new(change: dict[str, Any], model_display: str) -> str:
+    new_value = change.get("new_value")
+    if isinstance(new_value, dict):
+        inp = new_value.get("input_per_million", 0)
+        out = new_value.get("output_per_million", 0)
+        inp_spec = ".4f" if inp < 0.01 else ".3f" if inp < 1 else ".2f"
+        out_spec = ".4f" if out < 0.01 else ".3f" if out < 1 else ".2f"
+        return f"• {model_display}: ${inp:{inp_spec}}/${out:{out_spec}} per M tokens"
+    return f"• {model_display}"
+
+
+def _fmt_removed(change: dict[str, Any], model_display: str) -> str:
+    # No link for removed models
+    return f"• {_short_name(change.get('model_id', 'unknown'))}"
 
 
-def format_percent(percent: Optional[float]) -> str:
-    """Format percent change for display."""
+def _fmt_price_change(change: dict[str, Any], model_display: str) -> str:
+    old = change.get("old_value")
+    new = change.get("new_value")
+    percent = change.get("percent_change")
+    field_name = "input" if "input" in change.get("field", "") else "output"
+    old_spec = ".4f" if old < 0.01 else ".3f" if old < 1 else ".2f"
+    new_spec = ".4f" if new < 0.01 else ".3f" if new < 1 else ".2f"
     if percent is None:
-        return ""
-    sign = "+" if percent > 0 else ""
-    return f"({sign}{percent:.1f}%)"
+        pct = ""
+    else:
+        pct = f"({'+' if percent > 0 else ''}{percent:.1f}%)"
+    return f"• {model_display} ({field_name}): ${old:{old_spec}} → ${new:{new_spec}} {pct}"
+
+
+def _fmt_generic(change: dict[str, Any], model_display: str) -> str:
+    return f"• {model_display}: {change.get('field', '')} changed"
+
+
+_LINE_BUILDERS = {
+    "new_model": _fmt_new,
+    "removed_model": _fmt_removed,
+    "price_increase": _fmt_price_change,
+    "price_decrease": _fmt_price_change,
+}
 
 
 def format_change_line(change: dict[str, Any], include_links: bool = False) -> str:
@@ -71,43 +167,125 @@ def format_change_line(change: dict[str, Any], include_links: bool = False) -> s
         Formatted change line string
     """
     model_id = change.get("model_id", "unknown")
-    change_type = change.get("change_type", "")
-    field = change.get("field", "")
-    old_value = change.get("old_value")
-    new_value = change.get("new_value")
-    percent = change.get("percent_change")
-    
-    # Get short model name
-    model_name = model_id.split("/")[-1] if "/" in model_id else model_id
+    model_display = _short_name(model_id)
     
     # Create linked model name for Discord
     if include_links:
-        from urllib.parse import quote
         calc_url = f"{WEBSITE_URL}/calculator.html?model={quote(model_id)}"
-        model_display = f"[{model_name}]({calc_url})"
-    else:
-        model_display = model_name
+        model_display = f"[{model_display}]({calc_url})"
     
-    if change_type == "new_model":
-        if isinstance(new_value, dict):
-            input_price = new_value.get("input_per_million", 0)
-            output_price = new_value.get("output_per_million", 0)
-            return f"• {model_display}: {format_price(input_price)}/{format_price(output_price)} per M tokens"
-        return f"• {model_display}"
+    return _LINE_BUILDERS.get(change.get("change_type", ""), _fmt_generic)(change, model_display)
+
+
+class SummaryCounts(NamedTuple):
+    """Changelog summary counts shown in every alert."""
+    price_decreases: int
+    price_increases: int
+    new_models: int
+
+
+class SendResult(NamedTuple):
+    """Outcome of one notification send."""
+    name: str
+    ok: bool
+    info: str
+
+
+def _utf16_len(text: str) -> int:
+    """Length in UTF-16 code units, as Discord counts it (emoji may take two)."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def bucket_changes(changes: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """
+    Group changes by type in a single pass.
     
-    elif change_type == "removed_model":
-        return f"• {model_name}"  # No link for removed models
+    Changes without a change_type are grouped under "". The changes are
+    not modified (they may be shared with the load_json cache).
     
-    elif change_type in ("price_increase", "price_decrease"):
-        field_name = "input" if "input" in field else "output"
-        arrow = "→"
-        return f"• {model_display} ({field_name}): {format_price(old_value)} {arrow} {format_price(new_value)} {format_percent(percent)}"
+    Args:
+        changes: List of change dictionaries
+        
+    Returns:
+        Mapping of change type to the changes of that type; looking up a
+        type with no changes yields an empty list
+    """
+    buckets: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    for change in changes:
+        buckets[change.get("change_type", "")].append(change)
+    return buckets
+
+
+def format_bucket_lines(
+    buckets: dict[str, list[dict[str, Any]]],
+    limit: int,
+    include_links: bool = False
+) -> dict[str, list[str]]:
+    """
+    Format the first changes of each reported bucket once, for reuse.
     
-    else:
-        return f"• {model_display}: {field} changed"
+    Slack and email share the plain lines; Discord uses the linked ones.
+    
+    Args:
+        buckets: Changes grouped by type (see bucket_changes)
+        limit: Most lines any consumer shows per bucket
+        include_links: If True, include Discord markdown links to calculator
+        
+    Returns:
+        Mapping of change type to its formatted lines
+    """
+    return {
+        change_type: [
+            format_change_line(c, include_links)
+            for c in itertools.islice(buckets[change_type], limit)
+        ]
+        for change_type in REPORTED_CHANGE_TYPES
+    }
+
+
+def _render_sections(
+    buckets: dict[str, list[dict[str, Any]]],
+    lines: dict[str, list[str]],
+    limits: dict[str, int],
+    render_section: Callable[[str, Iterable[str], int], Any]
+) -> list[Any]:
+    """
+    Render one section per non-empty bucket, in the order of limits.
+    
+    Args:
+        buckets: Changes grouped by type (see bucket_changes)
+        lines: Preformatted lines per type (see format_bucket_lines)
+        limits: Maximum lines shown per type
+        render_section: Builds a platform section from (title, lines, remaining),
+            where remaining is how many changes did not fit
+        
+    Returns:
+        Rendered sections
+    """
+    return [
+        render_section(
+            SECTION_TITLES[change_type],
+            itertools.islice(lines[change_type], limit),
+            len(changes) - limit
+        )
+        for change_type, limit in limits.items()
+        if (changes := buckets[change_type])
+    ]
 
 
-def format_discord_message(changelog: dict[str, Any]) -> dict[str, Any]:
+def _discord_section(title: str, lines: Iterable[str], remaining: int) -> list[str]:
+    section = [f"**{title}:**", *lines]
+    if remaining > 0:
+        section.append(f"  ...and {remaining} more")
+    return section
+
+
+def format_discord_message(
+    changelog: dict[str, Any],
+    counts: SummaryCounts,
+    buckets: dict[str, list[dict[str, Any]]],
+    change_lines: dict[str, list[str]]
+) -> dict[str, Any]:
     """
     Create Discord embed format.
     
@@ -118,18 +296,18 @@ def format_discord_message(changelog: dict[str, Any]) -> dict[str, Any]:
     
     Args:
         changelog: Changelog data
+        counts: Summary counts (see SummaryCounts)
+        buckets: Changes grouped by type (see bucket_changes)
+        change_lines: Preformatted change lines (see format_bucket_lines)
         
     Returns:
         Discord webhook payload
     """
-    summary = changelog.get("summary", {})
-    changes = changelog.get("changes", [])
-    
     # Determine dominant change type for color
-    if summary.get("price_decreases", 0) > summary.get("price_increases", 0):
+    if counts.price_decreases > counts.price_increases:
         color = 0x00ff00  # Green
         emoji = "📉"
-    elif summary.get("price_increases", 0) > 0:
+    elif counts.price_increases > 0:
         color = 0xff0000  # Red
         emoji = "📈"
     else:
@@ -138,54 +316,31 @@ def format_discord_message(changelog: dict[str, Any]) -> dict[str, Any]:
     
     # Build description
     lines = [f"{emoji} **LLM Price Alert**\n"]
+    sections = _render_sections(
+        buckets, change_lines, DISCORD_SECTION_LIMITS, _discord_section
+    )
+    for section in sections:
+        if len(lines) > 1:
+            lines.append("")  # Blank line between sections
+        lines.extend(section)
+    
+    # Quick links always fit; change lines are dropped once the budget runs out
+    quick_links = [
+        "",
+        "**🔗 Quick Links:**",
+        f"[📊 Compare Models]({WEBSITE_URL}/compare.html) • [🧮 Calculator]({WEBSITE_URL}/calculator.html) • [📁 Raw Data]({WEBSITE_URL}/api.html)",
+    ]
+    budget = DISCORD_DESCRIPTION_BUDGET - sum(_utf16_len(line) + 1 for line in quick_links)
+    
+    kept = []
+    for line in lines:
+        budget -= _utf16_len(line) + 1  # +1 for the joining newline
+        if budget < 0:
+            kept.append("...")
+            break
+        kept.append(line)
     
-    # Group changes by type
-    price_decreases = [c for c in changes if c.get("change_type") == "price_decrease"]
-    price_increases = [c for c in changes if c.get("change_type") == "price_increase"]
-    new_models = [c for c in changes if c.get("change_type") == "new_model"]
-    removed_models = [c for c in changes if c.get("change_type") == "removed_model"]
-    
-    if price_decreases:
-        lines.append("**📉 Price Decreases:**")
-        for change in price_decreases[:10]:  # Limit to 10
-            lines.append(format_change_line(change, include_links=True))
-        if len(price_decreases) > 10:
-            lines.append(f"  ...and {len(price_decreases) - 10} more")
-        lines.append("")
-    
-    if price_increases:
-        lines.append("**📈 Price Increases:**")
-        for change in price_increases[:10]:
-            lines.append(format_change_line(change, include_links=True))
-        if len(price_increases) > 10:
-            lines.append(f"  ...and {len(price_increases) - 10} more")
-        lines.append("")
-    
-    if new_models:
-        lines.append("**🆕 New Models:**")
-        for change in new_models[:10]:
-            lines.append(format_change_line(change, include_links=True))
-        if len(new_models) > 10:
-            lines.append(f"  ...and {len(new_models) - 10} more")
-        lines.append("")
-    
-    if removed_models:
-        lines.append("**🗑️ Removed Models:**")
-        for change in removed_models[:5]:
-            lines.append(format_change_line(change))  # No links for removed
-        if len(removed_models) > 5:
-            lines.append(f"  ...and {len(removed_models) - 5} more")
-    
-    # Add quick links section
-    lines.append("")
-    lines.append("**🔗 Quick Links:**")
-    lines.append(f"[📊 Compare Models]({WEBSITE_URL}/compare.html) • [🧮 Calculator]({WEBSITE_URL}/calculator.html) • [📁 Raw Data]({WEBSITE_URL}/api.html)")
-    
-    description = "\n".join(lines)
-    
-    # Truncate if too long (Discord limit is 4096)
-    if len(description) > 4000:
-        description = description[:3997] + "..."
+    description = "\n".join(kept + quick_links)
     
     embed = {
         "title": "tokentracking Price Update",
@@ -203,151 +358,118 @@ def format_discord_message(changelog: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def format_slack_message(changelog: dict[str, Any]) -> dict[str, Any]:
+# Invariant Slack blocks; payloads are only serialized, so they are shared as-is
+_SLACK_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "🔔 LLM Price Alert",
+        "emoji": True
+    }
+}
+_SLACK_DIVIDER = {"type": "divider"}
+_SLACK_FOOTER = {
+    "type": "context",
+    "elements": [
+        {
+            "type": "mrkdwn",
+            "text": f"<{WEBSITE_URL}/changelog|View full changelog>"
+        }
+    ]
+}
+
+
+def _slack_section(title: str, lines: Iterable[str], remaining: int) -> dict[str, Any]:
+    parts = [f"*{title}:*", *lines]
+    if remaining > 0:
+        parts.append(f"_...and {remaining} more_")
+    return {
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": "\n".join(parts)}
+    }
+
+
+def format_slack_message(
+    counts: SummaryCounts,
+    buckets: dict[str, list[dict[str, Any]]],
+    change_lines: dict[str, list[str]]
+) -> dict[str, Any]:
     """
     Create Slack Block Kit format.
     
     Args:
-        changelog: Changelog data
+        counts: Summary counts (see SummaryCounts)
+        buckets: Changes grouped by type (see bucket_changes)
+        change_lines: Preformatted change lines (see format_bucket_lines)
         
     Returns:
         Slack webhook payload
     """
-    summary = changelog.get("summary", {})
-    changes = changelog.get("changes", [])
-    
     blocks = [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": "🔔 LLM Price Alert",
-                "emoji": True
-            }
-        },
+        _SLACK_HEADER_BLOCK,
         {
             "type": "section",
             "text": {
                 "type": "mrkdwn",
-                "text": f"*Summary:* {summary.get('price_decreases', 0)} decreases, {summary.get('price_increases', 0)} increases, {summary.get('new_models', 0)} new models"
+                "text": f"*Summary:* {counts.price_decreases} decreases, {counts.price_increases} increases, {counts.new_models} new models"
             }
         },
-        {"type": "divider"}
+        _SLACK_DIVIDER
     ]
     
-    # Group changes by type
-    price_decreases = [c for c in changes if c.get("change_type") == "price_decrease"]
-    price_increases = [c for c in changes if c.get("change_type") == "price_increase"]
-    new_models = [c for c in changes if c.get("change_type") == "new_model"]
-    
-    if price_decreases:
-        text = "*📉 Price Decreases:*\n"
-        for change in price_decreases[:8]:
-            text += format_change_line(change) + "\n"
-        if len(price_decreases) > 8:
-            text += f"_...and {len(price_decreases) - 8} more_"
-        
-        blocks.append({
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": text}
-        })
-    
-    if price_increases:
-        text = "*📈 Price Increases:*\n"
-        for change in price_increases[:8]:
-            text += format_change_line(change) + "\n"
-        if len(price_increases) > 8:
-            text += f"_...and {len(price_increases) - 8} more_"
-        
-        blocks.append({
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": text}
-        })
-    
-    if new_models:
-        text = "*🆕 New Models:*\n"
-        for change in new_models[:8]:
-            text += format_change_line(change) + "\n"
-        if len(new_models) > 8:
-            text += f"_...and {len(new_models) - 8} more_"
-        
-        blocks.append({
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": text}
-        })
+    blocks.extend(_render_sections(
+        buckets, change_lines, SLACK_SECTION_LIMITS, _slack_section
+    ))
     
     # Add footer with link
-    blocks.append({"type": "divider"})
-    blocks.append({
-        "type": "context",
-        "elements": [
-            {
-                "type": "mrkdwn",
-                "text": f"<{WEBSITE_URL}/changelog|View full changelog>"
-            }
-        ]
-    })
+    blocks.append(_SLACK_DIVIDER)
+    blocks.append(_SLACK_FOOTER)
     
     return {"blocks": blocks}
 
 
-def format_email(changelog: dict[str, Any]) -> tuple[str, str]:
+def _email_section(title: str, lines: Iterable[str], remaining: int) -> list[str]:
+    parts = [f"<h3>{title}</h3><ul>"]
+    parts.extend(f"<li>{line[2:]}</li>" for line in lines)  # Remove bullet
+    if remaining > 0:
+        parts.append(f"<li><em>...and {remaining} more</em></li>")
+    parts.append("</ul>")
+    return parts
+
+
+def format_email(
+    counts: SummaryCounts,
+    buckets: dict[str, list[dict[str, Any]]],
+    change_lines: dict[str, list[str]]
+) -> tuple[str, str]:
     """
     Create HTML email body for Buttondown.
     
     Args:
-        changelog: Changelog data
+        counts: Summary counts (see SummaryCounts)
+        buckets: Changes grouped by type (see bucket_changes)
+        change_lines: Preformatted change lines (see format_bucket_lines)
         
     Returns:
         Tuple of (subject, html_body)
     """
-    summary = changelog.get("summary", {})
-    changes = changelog.get("changes", [])
-    
-    total_changes = (
-        summary.get("price_decreases", 0) +
-        summary.get("price_increases", 0) +
-        summary.get("new_models", 0)
-    )
+    total_changes = sum(counts)
     
     subject = f"🔔 LLM Price Alert: {total_changes} changes detected"
     
     # Build HTML body
     html_parts = [
         "<h2>🔔 LLM Price Alert</h2>",
-        f"<p><strong>Summary:</strong> {summary.get('price_decreases', 0)} price decreases, ",
-        f"{summary.get('price_increases', 0)} price increases, {summary.get('new_models', 0)} new models</p>",
+        f"<p><strong>Summary:</strong> {counts.price_decreases} price decreases, ",
+        f"{counts.price_increases} price increases, {counts.new_models} new models</p>",
         "<hr>"
     ]
     
-    # Group changes
-    price_decreases = [c for c in changes if c.get("change_type") == "price_decrease"]
-    price_increases = [c for c in changes if c.get("change_type") == "price_increase"]
-    new_models = [c for c in changes if c.get("change_type") == "new_model"]
-    
-    if price_decreases:
-        html_parts.append("<h3>📉 Price Decreases</h3><ul>")
-        for change in price_decreases[:15]:
-            html_parts.append(f"<li>{format_change_line(change)[2:]}</li>")  # Remove bullet
-        if len(price_decreases) > 15:
-            html_parts.append(f"<li><em>...and {len(price_decreases) - 15} more</em></li>")
-        html_parts.append("</ul>")
-    
-    if price_increases:
-        html_parts.append("<h3>📈 Price Increases</h3><ul>")
-        for change in price_increases[:15]:
-            html_parts.append(f"<li>{format_change_line(change)[2:]}</li>")
-        if len(price_increases) > 15:
-            html_parts.append(f"<li><em>...and {len(price_increases) - 15} more</em></li>")
-        html_parts.append("</ul>")
-    
-    if new_models:
-        html_parts.append("<h3>🆕 New Models</h3><ul>")
-        for change in new_models[:15]:
-            html_parts.append(f"<li>{format_change_line(change)[2:]}</li>")
-        if len(new_models) > 15:
-            html_parts.append(f"<li><em>...and {len(new_models) - 15} more</em></li>")
-        html_parts.append("</ul>")
+    sections = _render_sections(
+        buckets, change_lines, EMAIL_SECTION_LIMITS, _email_section
+    )
+    for section in sections:
+        html_parts.extend(section)
     
     html_parts.extend([
         "<hr>",
@@ -358,96 +480,243 @@ def format_email(changelog: dict[str, Any]) -> tuple[str, str]:
     return subject, "\n".join(html_parts)
 
 
-def send_discord(message: dict[str, Any]) -> bool:
+class RetryPolicy(NamedTuple):
+    """When a failed POST may be sent again."""
+    statuses: frozenset[int]  # Retried only when the server says when to retry
+    errors: tuple[type[httpx.HTTPError], ...]
+    max_attempts: int = MAX_POST_ATTEMPTS
+
+
+# Every alert POST posts a message (Buttondown publishes to all subscribers),
+# so only retry when the server cannot have processed the request: the
+# connection never opened, or it was rejected with an explicit Retry-After.
+UNPROCESSED_RETRY = RetryPolicy(
+    statuses=frozenset({429, 503}),
+    errors=(httpx.ConnectError, httpx.ConnectTimeout),
+)
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
     """
-    Send message to Discord webhook.
+    Server-requested delay in seconds, capped at MAX_RETRY_DELAY.
+    
+    Reads the Retry-After header, or Discord's retry_after body field on
+    429; returns None when the server gave no hint.
+    """
+    try:
+        return min(float(response.headers["Retry-After"]), MAX_RETRY_DELAY)
+    except (KeyError, ValueError):
+        pass  # Missing, or an HTTP date
+    if response.status_code == 429:
+        try:
+            return min(float(orjson.loads(response.content)["retry_after"]), MAX_RETRY_DELAY)
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+            pass
+    return None
+
+
+async def _post_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    payload: dict[str, Any],
+    policy: RetryPolicy,
+    headers: Optional[dict[str, str]] = None
+) -> httpx.Response:
+    """
+    POST a JSON payload, retrying failures the policy allows.
+    
+    Statuses in the policy are retried only after the server-requested
+    delay; connection errors back off exponentially with jitter. The last
+    attempt's response is returned (or its error raised) as-is.
     
     Args:
-        message: Discord webhook payload
+        client: Shared async HTTP client
+        url: Target URL
+        payload: JSON-serializable request body
+        policy: Which failures may be retried, and how often
+        headers: Extra request headers
         
     Returns:
-        True if successful, False otherwise
+        The final response
     """
-    # Check both WEBHOOK_URL (user's secret name) and DISCORD_WEBHOOK_URL (spec name)
-    webhook_url = os.environ.get("WEBHOOK_URL") or os.environ.get("DISCORD_WEBHOOK_URL")
-    
-    if not webhook_url:
-        print("⚠ WEBHOOK_URL / DISCORD_WEBHOOK_URL not set, skipping Discord notification")
-        return False
+    content = orjson.dumps(payload)
+    headers = {**JSON_HEADERS, **(headers or {})}
+    
+    for attempt in range(policy.max_attempts - 1):
+        try:
+            response = await client.post(url, content=content, headers=headers)
+        except policy.errors:
+            delay = min(2 ** attempt + random.random(), MAX_RETRY_DELAY)
+        else:
+            if response.status_code not in policy.statuses:
+                return response
+            delay = _retry_after(response)
+            if delay is None:
+                return response
+        await asyncio.sleep(delay)
+    
+    return await client.post(url, content=content, headers=headers)
+
+
+async def _send(
+    name: str,
+    client: httpx.AsyncClient,
+    url: str,
+    payload: dict[str, Any],
+    policy: RetryPolicy,
+    headers: Optional[dict[str, str]] = None
+) -> SendResult:
+    """
+    POST a notification and summarize the outcome on one line.
     
+    Errors are reported by status code or exception type, never by URL,
+    since webhook URLs carry their secrets.
+    """
     try:
-        with httpx.Client(timeout=REQUEST_TIMEOUT) as client:
-            response = client.post(webhook_url, json=message)
-            response.raise_for_status()
-            print("✓ Discord notification sent successfully")
-            return True
+        response = await _post_with_retry(client, url, payload, policy, headers)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        return SendResult(name, False, f"HTTP {e.response.status_code}")
     except httpx.HTTPError as e:
-        print(f"❌ Failed to send Discord notification: {e}")
-        return False
+        return SendResult(name, False, f"{type(e).__name__}: {e}")
+    return SendResult(name, True, f"HTTP {response.status_code}")
 
 
-def send_slack(message: dict[str, Any]) -> bool:
+async def send_discord(
+    client: httpx.AsyncClient, webhook_url: str, message: dict[str, Any]
+) -> SendResult:
+    """
+    Send message to Discord webhook.
+    
+    Args:
+        client: Shared async HTTP client
+        webhook_url: Discord webhook URL
+        message: Discord webhook payload
+        
+    Returns:
+        Result of the send
+    """
+    return await _send("discord", client, webhook_url, message, UNPROCESSED_RETRY)
+
+
+async def send_slack(
+    client: httpx.AsyncClient, webhook_url: str, message: dict[str, Any]
+) -> SendResult:
     """
     Send message to Slack webhook.
     
     Args:
+        client: Shared async HTTP client
+        webhook_url: Slack webhook URL
         message: Slack webhook payload
         
     Returns:
-        True if successful, False otherwise
+        Result of the send
     """
-    webhook_url = os.environ.get("SLACK_WEBHOOK_URL")
-    
-    if not webhook_url:
-        print("⚠ SLACK_WEBHOOK_URL not set, skipping Slack notification")
-        return False
-    
-    try:
-        with httpx.Client(timeout=REQUEST_TIMEOUT) as client:
-            response = client.post(webhook_url, json=message)
-            response.raise_for_status()
-            print("✓ Slack notification sent successfully")
-            return True
-    except httpx.HTTPError as e:
-        print(f"❌ Failed to send Slack notification: {e}")
-        return False
+    return await _send("slack", client, webhook_url, message, UNPROCESSED_RETRY)
 
 
-def send_email(changelog: dict[str, Any]) -> bool:
+async def send_email(
+    client: httpx.AsyncClient, api_key: str, subject: str, body: str
+) -> SendResult:
     """
     Send email via Buttondown API.
     
     Args:
-        changelog: Changelog data
+        client: Shared async HTTP client
+        api_key: Buttondown API key
+        subject: Email subject
+        body: HTML email body
         
     Returns:
-        True if successful, False otherwise
+        Result of the send
+    """
+    return await _send(
+        "email",
+        client,
+        "https://api.buttondown.email/v1/emails",
+        {
+            "subject": subject,
+            "body": body,
+            "status": "published"  # Sends immediately to all subscribers
+        },
+        UNPROCESSED_RETRY,
+        headers={"Authorization": f"Token {api_key}"}
+    )
+
+
+async def _dispatch(
+    changelog: dict[str, Any],
+    counts: SummaryCounts,
+    buckets: dict[str, list[dict[str, Any]]],
+    include_email: bool
+) -> list[SendResult]:
     """
-    api_key = os.environ.get("BUTTONDOWN_API_KEY")
+    Send all notifications concurrently over one shared HTTP client.
     
-    if not api_key:
-        print("⚠ BUTTONDOWN_API_KEY not set, skipping email notification")
-        return False
+    Payloads are only built for channels whose credentials are set. A
+    failure in one channel never cancels the others: exceptions are
+    collected and reported as a failed send.
+    
+    Args:
+        changelog: Changelog data
+        counts: Summary counts (see SummaryCounts)
+        buckets: Changes grouped by type (see bucket_changes)
+        include_email: Whether to send the Buttondown email
+        
+    Returns:
+        One result per attempted send; unconfigured channels are skipped
+    """
+    # Check both WEBHOOK_URL (user's secret name) and DISCORD_WEBHOOK_URL (spec name)
+    discord_url = os.environ.get("WEBHOOK_URL") or os.environ.get("DISCORD_WEBHOOK_URL")
+    slack_url = os.environ.get("SLACK_WEBHOOK_URL")
+    api_key = os.environ.get("BUTTONDOWN_API_KEY") if include_email else None
+    
+    # Pending sends, each awaiting only the shared client
+    senders = {}
+    
+    if discord_url:
+        linked = format_bucket_lines(buckets, LINKED_LINE_LIMIT, include_links=True)
+        message = format_discord_message(changelog, counts, buckets, linked)
+        senders["discord"] = functools.partial(
+            send_discord, webhook_url=discord_url, message=message
+        )
+    else:
+        logger.warning("⚠ WEBHOOK_URL / DISCORD_WEBHOOK_URL not set, skipping Discord notification")
     
-    subject, body = format_email(changelog)
+    # Slack and email share the plain lines
+    plain = format_bucket_lines(buckets, PLAIN_LINE_LIMIT) if slack_url or api_key else {}
     
-    try:
-        with httpx.Client(timeout=REQUEST_TIMEOUT) as client:
-            response = client.post(
-                "https://api.buttondown.email/v1/emails",
-                headers={"Authorization": f"Token {api_key}"},
-                json={
-                    "subject": subject,
-                    "body": body,
-                    "status": "published"  # Sends immediately to all subscribers
-                }
-            )
-            response.raise_for_status()
-            print("✓ Email notification sent successfully")
-            return True
-    except httpx.HTTPError as e:
-        print(f"❌ Failed to send email notification: {e}")
-        return False
+    if slack_url:
+        message = format_slack_message(counts, buckets, plain)
+        senders["slack"] = functools.partial(
+            send_slack, webhook_url=slack_url, message=message
+        )
+    else:
+        logger.warning("⚠ SLACK_WEBHOOK_URL not set, skipping Slack notification")
+    
+    if api_key:
+        subject, body = format_email(counts, buckets, plain)
+        senders["email"] = functools.partial(
+            send_email, api_key=api_key, subject=subject, body=body
+        )
+    elif include_email:
+        logger.warning("⚠ BUTTONDOWN_API_KEY not set, skipping email notification")
+    
+    if not senders:
+        return []
+    
+    async with httpx.AsyncClient(
+        timeout=REQUEST_TIMEOUT, http2=True, limits=HTTP_LIMITS
+    ) as client:
+        outcomes = await asyncio.gather(
+            *(send(client) for send in senders.values()), return_exceptions=True
+        )
+    
+    return [
+        SendResult(name, False, str(outcome)) if isinstance(outcome, BaseException) else outcome
+        for name, outcome in zip(senders, outcomes)
+    ]
 
 
 def create_test_changelog() -> dict[str, Any]:
@@ -520,77 +789,84 @@ def main() -> None:
     )
     args = parser.parse_args()
     
-    print("=" * 60)
-    print("tokentracking - Alert Sender")
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    # httpx logs each request URL at INFO, and webhook URLs embed their secrets
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    
+    logger.info("%s\ntokentracking - Alert Sender", RULE)
     if args.test:
-        print("🧪 TEST MODE - Using dummy changelog data")
-    print(f"Started at: {datetime.now(timezone.utc).isoformat()}")
-    print("=" * 60)
+        logger.info("🧪 TEST MODE - Using dummy changelog data")
+    logger.info("Started at: %s\n%s", datetime.now(timezone.utc).isoformat(), RULE)
     
     # Load changelog (or use test data)
     if args.test:
-        print("\n📂 Creating test changelog...")
+        logger.info("\n📂 Creating test changelog...")
         changelog = create_test_changelog()
-        print("✓ Created test changelog with sample price changes")
+        logger.info("✓ Created test changelog with sample price changes")
     else:
         changelog_path = CHANGELOG_DIR / "latest.json"
         
         if not changelog_path.exists():
-            print("⚠ No changelog found at", changelog_path)
-            print("  Run detect_changes.py first to generate changelog")
-            print("  Or use --test to send a test notification")
+            logger.warning(
+                "⚠ No changelog found at %s\n"
+                "  Run detect_changes.py first to generate changelog\n"
+                "  Or use --test to send a test notification",
+                changelog_path
+            )
             return
         
-        print("\n📂 Loading changelog...")
+        logger.info("\n📂 Loading changelog...")
         changelog = load_json(changelog_path)
         
         # Check if already notified to prevent duplicate alerts
         if changelog.get("notified", False):
-            print("⚠ This changelog was already notified at:", changelog.get("notified_at", "unknown"))
-            print("  Skipping to avoid duplicate alerts")
-            print("  (latest.json is kept for API access)")
+            logger.warning(
+                "⚠ This changelog was already notified at: %s\n"
+                "  Skipping to avoid duplicate alerts\n"
+                "  (latest.json is kept for API access)",
+                changelog.get("notified_at", "unknown")
+            )
             return
     
     changes = changelog.get("changes", [])
     summary = changelog.get("summary", {})
+    counts = SummaryCounts(
+        summary.get("price_decreases", 0),
+        summary.get("price_increases", 0),
+        summary.get("new_models", 0),
+    )
+    
+    logger.info("✓ Changelog has %d changes\n  Summary: %s", len(changes), summary)
     
-    print(f"✓ Changelog has {len(changes)} changes")
-    print(f"  Summary: {summary}")
+    # Group once; every formatter reads the same buckets
+    buckets = bucket_changes(changes)
     
-    if not changes:
-        print("\n⚠ No changes to report, skipping notifications")
+    if not any(buckets[t] for t in REPORTED_CHANGE_TYPES):
+        logger.warning("\n⚠ No changes to report, skipping notifications")
         return
     
     # Send notifications
-    print("\n📤 Sending notifications...")
+    logger.info("\n📤 Sending notifications...")
     
-    results = {
-        "discord": False,
-        "slack": False,
-        "email": False
-    }
-    
-    # Discord
-    discord_message = format_discord_message(changelog)
-    results["discord"] = send_discord(discord_message)
+    # Email is skipped in test mode to avoid spamming subscribers
+    if args.test:
+        logger.warning("⚠ Skipping email in test mode to avoid spamming subscribers")
     
-    # Slack
-    slack_message = format_slack_message(changelog)
-    results["slack"] = send_slack(slack_message)
+    results = asyncio.run(_dispatch(changelog, counts, buckets, include_email=not args.test))
     
-    # Email (skip in test mode to avoid spamming subscribers)
-    if args.test:
-        print("⚠ Skipping email in test mode to avoid spamming subscribers")
-    else:
-        results["email"] = send_email(changelog)
+    for result in results:
+        if result.ok:
+            logger.info("✓ %s: sent (%s)", result.name, result.info)
+        else:
+            logger.error("❌ %s: failed (%s)", result.name, result.info)
     
     # Summary
-    print("\n" + "=" * 60)
-    sent_count = sum(1 for v in results.values() if v)
-    skipped_count = sum(1 for v in results.values() if not v)
-    print(f"✅ Alert sending completed: {sent_count} sent, {skipped_count} skipped")
+    logger.info("\n%s", RULE)
+    sent_count = sum(result.ok for result in results)
+    skipped_count = len(CHANNELS) - sent_count
+    logger.info("✅ Alert sending completed: %d sent, %d skipped", sent_count, skipped_count)
     if args.test:
-        print("🧪 This was a TEST notification with dummy data")
+        logger.info("🧪 This was a TEST notification with dummy data")
     else:
         # Mark latest.json as notified to prevent duplicate alerts
         # This keeps the file available for API access while avoiding re-sends
@@ -598,10 +874,11 @@ def main() -> None:
         if sent_count > 0 and changelog_path.exists():
             changelog["notified"] = True
             changelog["notified_at"] = datetime.now(timezone.utc).isoformat()
-            with open(changelog_path, "w", encoding="utf-8") as f:
-                json.dump(changelog, f, indent=2)
-            print("✓ Marked latest.json as notified (kept for API access)")
-    print("=" * 60)
+            write_atomic(changelog_path, orjson.dumps(
+                changelog, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            ))
+            logger.info("✓ Marked latest.json as notified (kept for API access)")
+    logger.info(RULE)
 
 
 if __name__ == "__main__":